@@ -4,8 +4,5 @@ SCRIPTS_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd )"
 
 cd ${SCRIPTS_DIR}/../
 
-# Create package files
-python3 setup.py sdist --format=gztar
-
-# Wheel file
-python3 setup.py bdist_wheel
+# Create the source distribution and the pure-python (py3-none-any) wheel
+python3 -m build --sdist --wheel
@@ -15,10 +15,12 @@
 
 
 import importlib
+import io
 import sys
+from functools import lru_cache
 import os
-import inspect
-import configparser
+import stat
+from enum import Enum
 import unified_planning as up
 from unified_planning.environment import Environment
 from unified_planning.model import ProblemKind
@@ -33,9 +35,26 @@ from unified_planning.engines.mixins.portfolio import PortfolioSelectorMixin
 from unified_planning.engines.mixins.replanner import ReplannerMixin
 from unified_planning.engines.mixins.simulator import SimulatorMixin
 from unified_planning.engines.engine import OperationMode
-from typing import IO, Any, Dict, Tuple, Optional, List, Union, Type, cast
-from pathlib import PurePath
-
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Set,
+    Tuple,
+    Optional,
+    List,
+    Union,
+    Type,
+    TypeVar,
+    cast,
+    overload,
+)
+
+
+# The ProblemKind used when no problem kind is given, shared by the Factory methods
+_EMPTY_KIND = ProblemKind()
 
 DEFAULT_ENGINES = {
     "fast-downward": ("up_fast_downward", "FastDownwardPDDLPlanner"),
@@ -116,31 +135,290 @@ DEFAULT_META_ENGINES_PREFERENCE_LIST = ["oversubscription"]
 
 
 def format_table(header: List[str], rows: List[List[str]]) -> str:
-    row_template = "|"
-    for i in range(len(header)):
-        l = max(len(r[i]) for r in [header] + rows)
-        row_template += f" {{:<{str(l)}}} |"
-    header_str = row_template.format(*header)
-    row_len = len(header_str)
-    rows_str = [f'{"-"*row_len}', f"{header_str}", f'{"="*row_len}']
+    widths = [len(h) for h in header]
+    for row in rows:
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+    row_template = "|" + "".join(f" {{:<{w}}} |" for w in widths)
+    row_len = sum(widths) + 3 * len(widths) + 1
+    separator = "-" * row_len
+    rows_str = [separator, row_template.format(*header), "=" * row_len]
     for row in rows:
-        rows_str.append(f"{row_template.format(*row)}")
-        rows_str.append(f'{"-"*row_len}')
+        rows_str.append(row_template.format(*row))
+        rows_str.append(separator)
     return "\n".join(rows_str)
 
 
+# The bit representing each OperationMode in the masks returned by _operation_modes_mask
+_OPERATION_MODE_BITS: Dict[OperationMode, int] = {
+    om: 1 << i for i, om in enumerate(OperationMode)
+}
+
+
+def _operation_modes_mask(engine_class: Type["up.engines.engine.Engine"]) -> int:
+    """Returns the bitmask of the `OperationModes` implemented by the given `Engine` class."""
+    mask = 0
+    for om, bit in _OPERATION_MODE_BITS.items():
+        if getattr(engine_class, "is_" + om.value)():
+            mask |= bit
+    return mask
+
+
+@lru_cache(maxsize=1024)
+def _supports_kind(
+    engine_class: Type["up.engines.engine.Engine"], features: FrozenSet[str]
+) -> bool:
+    """Returns `True` iff the given `Engine` class supports the given problem features."""
+    return engine_class.supports(ProblemKind(set(features)))
+
+
+@lru_cache(maxsize=1024)
+def _supports_feature(
+    engine_class: Type["up.engines.engine.Engine"], feature: str
+) -> bool:
+    """Returns `True` iff the given `Engine` class supports the given problem feature."""
+    return engine_class.supports(ProblemKind({feature}))
+
+
+@lru_cache(maxsize=1024)
+def _default_credits(
+    engine_class: Type["up.engines.engine.Engine"],
+) -> Optional["up.engines.Credits"]:
+    """Returns the `Credits` of the given `Engine` class, when no options are given."""
+    return engine_class.get_credits()
+
+
+@lru_cache(maxsize=1024)
+def _is_compatible_engine(
+    meta_engine_class: Type["up.engines.meta_engine.MetaEngine"],
+    engine_class: Type["up.engines.engine.Engine"],
+) -> bool:
+    """Returns `True` iff the given `MetaEngine` class can be instantiated over the given `Engine` class."""
+    return meta_engine_class.is_compatible_engine(engine_class)
+
+
+@lru_cache(maxsize=128)
+def _unsupported_features_table(
+    engines: Tuple[Tuple[str, Type["up.engines.engine.Engine"]], ...],
+    features: FrozenSet[str],
+) -> str:
+    """
+    Returns the table reporting which of the given problem features are supported
+    by each of the given (name, `Engine` class) pairs.
+    """
+    problem_features = list(features)
+    planners_features = [
+        [name] + [str(_supports_feature(EngineClass, f)) for f in problem_features]
+        for name, EngineClass in engines
+    ]
+    header = ["Engine"] + problem_features
+    return format_table(header, planners_features)
+
+
+@lru_cache(maxsize=16)
+def _read_config(files: Tuple[Tuple[str, int], ...]) -> Dict[str, Dict[str, str]]:
+    """
+    Parses the given configuration files, returning the options of each section.
+
+    The files are given together with their modification time, so that the cached
+    result is not used anymore once a file is modified.
+    """
+    # configparser is imported here, so that it is not imported when no
+    # configuration file is found
+    import configparser
+
+    config = configparser.ConfigParser()
+    config.read([f for f, _ in files])
+    return {s: dict(config.items(s)) for s in config.sections()}
+
+
+EnumType = TypeVar("EnumType", bound=Enum)
+
+
+@overload
+def _coerce_enum(enum_class: Type[EnumType], value: Union[EnumType, str]) -> EnumType:
+    ...
+
+
+@overload
+def _coerce_enum(
+    enum_class: Type[EnumType], value: Optional[Union[EnumType, str]]
+) -> Optional[EnumType]:
+    ...
+
+
+def _coerce_enum(
+    enum_class: Type[EnumType], value: Optional[Union[EnumType, str]]
+) -> Optional[EnumType]:
+    """
+    Returns the member of the given `Enum` named `value` if `value` is a string,
+    `value` itself otherwise.
+    """
+    if isinstance(value, str):
+        return enum_class[value]
+    return value
+
+
+def _instantiate_engine(
+    EngineClass: Type["up.engines.engine.Engine"], params: Dict[str, Any], **_: Any
+) -> "up.engines.engine.Engine":
+    return EngineClass(**params)
+
+
+def _instantiate_replanner(
+    EngineClass: Type["up.engines.engine.Engine"],
+    params: Dict[str, Any],
+    *,
+    problem: Optional["up.model.AbstractProblem"],
+    problem_kind: Optional[ProblemKind],
+    optimality_guarantee: Optional["OptimalityGuarantee"],
+    **_: Any,
+) -> "up.engines.engine.Engine":
+    assert problem is not None
+    if optimality_guarantee == OptimalityGuarantee.SOLVED_OPTIMALLY:
+        # problem_kind is the kind of the problem, when already computed by the Factory
+        if problem_kind is None:
+            problem_kind = problem.kind
+        if problem_kind.has_quality_metrics():
+            msg = f"The problem has no quality metrics but the engine is required to be optimal!"
+            raise up.exceptions.UPUsageError(msg)
+    return EngineClass(problem=problem, **params)
+
+
+def _instantiate_simulator(
+    EngineClass: Type["up.engines.engine.Engine"],
+    params: Dict[str, Any],
+    *,
+    problem: Optional["up.model.AbstractProblem"],
+    error_on_failed_checks: bool,
+    **_: Any,
+) -> "up.engines.engine.Engine":
+    assert problem is not None
+    res = EngineClass(
+        problem=problem,
+        error_on_failed_checks=error_on_failed_checks,
+        **params,
+    )
+    assert isinstance(res, SimulatorMixin)
+    return res
+
+
+def _instantiate_compiler(
+    EngineClass: Type["up.engines.engine.Engine"],
+    params: Dict[str, Any],
+    *,
+    compilation_kind: Optional["CompilationKind"],
+    **_: Any,
+) -> "up.engines.engine.Engine":
+    res = EngineClass(**params)
+    assert isinstance(res, CompilerMixin)
+    if compilation_kind is not None:
+        res.default = compilation_kind
+    return res
+
+
+def _instantiate_oneshot_planner(
+    EngineClass: Type["up.engines.engine.Engine"],
+    params: Dict[str, Any],
+    *,
+    optimality_guarantee: Optional["OptimalityGuarantee"],
+    **_: Any,
+) -> "up.engines.engine.Engine":
+    res = EngineClass(**params)
+    assert isinstance(res, OneshotPlannerMixin) or isinstance(
+        res, PortfolioSelectorMixin
+    )
+    if optimality_guarantee == OptimalityGuarantee.SOLVED_OPTIMALLY:
+        res.optimality_metric_required = True
+    return res
+
+
+def _instantiate_anytime_planner(
+    EngineClass: Type["up.engines.engine.Engine"],
+    params: Dict[str, Any],
+    *,
+    anytime_guarantee: Optional["AnytimeGuarantee"],
+    **_: Any,
+) -> "up.engines.engine.Engine":
+    res = EngineClass(**params)
+    assert isinstance(res, AnytimePlannerMixin)
+    if (
+        anytime_guarantee == AnytimeGuarantee.INCREASING_QUALITY
+        or anytime_guarantee == AnytimeGuarantee.OPTIMAL_PLANS
+    ):
+        res.optimality_metric_required = True
+    return res
+
+
+# The functions instantiating the engines of each operation mode, operation modes
+# that do not need any particular setup use _instantiate_engine. They all receive
+# the Factory request by keyword and declare only the arguments they need.
+_INSTANTIATORS: Dict[OperationMode, Callable[..., "up.engines.engine.Engine"]] = {
+    OperationMode.REPLANNER: _instantiate_replanner,
+    OperationMode.SIMULATOR: _instantiate_simulator,
+    OperationMode.COMPILER: _instantiate_compiler,
+    OperationMode.ONESHOT_PLANNER: _instantiate_oneshot_planner,
+    OperationMode.PORTFOLIO_SELECTOR: _instantiate_oneshot_planner,
+    OperationMode.ANYTIME_PLANNER: _instantiate_anytime_planner,
+}
+
+
+@lru_cache(maxsize=None)
+def _config_locations(script_path: str, home: str) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Returns the candidate configuration files, grouped by directory: the `up.ini`
+    and `.up.ini` files of each parent directory of the script, from the closest,
+    and finally the `up.ini`, `.up.ini` and `.uprc` files in the home directory.
+
+    Only the paths are memoized, the files existence must be checked every time.
+    """
+    groups: List[Tuple[str, ...]] = []
+    directory = os.path.dirname(script_path)
+    while True:
+        groups.append(
+            (os.path.join(directory, "up.ini"), os.path.join(directory, ".up.ini"))
+        )
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+    groups.append(tuple(os.path.join(home, n) for n in ("up.ini", ".up.ini", ".uprc")))
+    return tuple(groups)
+
+
+def _existing_config_files() -> List[Tuple[str, int]]:
+    """
+    Returns the configuration files found by `get_possible_config_locations`,
+    each with its modification time.
+    """
+    # The configuration is searched starting from the script that was run,
+    # which is the file of the outermost frame of the call stack.
+    frame = sys._getframe()
+    while frame.f_back is not None:
+        frame = frame.f_back
+    script_path = os.path.abspath(frame.f_code.co_filename)
+    for group in _config_locations(script_path, os.path.expanduser("~")):
+        files = []
+        for f in group:
+            try:
+                st = os.stat(f)
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode):
+                files.append((f, st.st_mtime_ns))
+        if len(files) > 0:
+            return files
+    return []
+
+
 def get_possible_config_locations() -> List[str]:
-    """Returns all the possible location of the configuration file."""
-    home = os.path.expanduser("~")
-    files = []
-    stack = inspect.stack()
-    for p in PurePath(os.path.abspath(stack[-1].filename)).parents:
-        files.append(os.path.join(p, "up.ini"))
-        files.append(os.path.join(p, ".up.ini"))
-    files.append(os.path.join(home, "up.ini"))
-    files.append(os.path.join(home, ".up.ini"))
-    files.append(os.path.join(home, ".uprc"))
-    return files
+    """
+    Returns the existing configuration files: the `up.ini` and `.up.ini` files of the
+    closest parent directory of the running script that has any or, otherwise, the
+    `up.ini`, `.up.ini` and `.uprc` files in the home directory.
+    """
+    return [f for f, _ in _existing_config_files()]
 
 
 class Factory:
@@ -152,30 +430,49 @@ class Factory:
     def __init__(self, env: "Environment"):
         self._env = env
         self._engines: Dict[str, Type["up.engines.engine.Engine"]] = {}
-        self._engines_info: List[Tuple[str, str, str]] = []
+        # The (module_name, class_name) of the added engines and meta engines,
+        # used to re-import them when the Factory is unpickled.
+        self._engines_info: Dict[str, Tuple[str, str]] = {}
         self._meta_engines: Dict[str, Type["up.engines.meta_engine.MetaEngine"]] = {}
-        self._meta_engines_info: List[Tuple[str, str, str]] = []
+        self._meta_engines_info: Dict[str, Tuple[str, str]] = {}
+        # The bitmask of the operation modes implemented by each engine in _engines
+        self._engine_masks: Dict[str, int] = {}
+        # The default engines are imported only when they are needed; until then
+        # they are stored in _lazy_engines, mapped to their (module_name, class_name),
+        # while the meta engines waiting for them are stored in _lazy_meta_engines,
+        # mapped to their (meta_engine_name, engine_name).
+        self._lazy_engines: Dict[str, Tuple[str, str]] = dict(DEFAULT_ENGINES)
+        self._lazy_meta_engines: Dict[str, Tuple[str, str]] = {}
+        # The modules of the default engines that failed to import; failed imports
+        # are not cached by python, so they are not attempted again.
+        self._unavailable_modules: Set[str] = set()
+        # Caches depending on the preference list, valid as long as it does not
+        # change: the engine classes returned by _get_engine_class and, for
+        # each operation mode, the names of the preferred engines implementing it.
+        self._engine_class_cache: Dict[Tuple, Type["up.engines.engine.Engine"]] = {}
+        self._engines_by_mode: Dict["OperationMode", Tuple[str, ...]] = {}
+        self._cached_preference_list: List[str] = []
         self._credit_disclaimer_printed = False
-        for name, (module_name, class_name) in DEFAULT_ENGINES.items():
-            try:
-                self._add_engine(name, module_name, class_name)
-            except ImportError:
-                pass
-        engines = dict(self._engines)
         for name, (module_name, class_name) in DEFAULT_META_ENGINES.items():
             try:
-                for engine_name, engine in engines.items():
-                    self._add_meta_engine(
-                        name, module_name, class_name, engine_name, engine
-                    )
+                self._register_meta_engine(name, module_name, class_name)
             except ImportError:
-                pass
+                continue
+            for engine_name in self._lazy_engines:
+                n = sys.intern(f"{name}[{engine_name}]")
+                self._lazy_meta_engines[n] = (name, engine_name)
+        # The default engines and meta engines instances in registration order,
+        # which does not depend on the order in which they are imported.
+        self._default_engine_names: Tuple[str, ...] = (
+            *self._lazy_engines,
+            *self._lazy_meta_engines,
+        )
         self._preference_list = []
         for name in DEFAULT_ENGINES_PREFERENCE_LIST:
-            if name in self._engines:
+            if name in self._lazy_engines:
                 self._preference_list.append(name)
         for name in DEFAULT_META_ENGINES_PREFERENCE_LIST:
-            for e in self._engines.keys():
+            for e in self._lazy_meta_engines.keys():
                 if e.startswith(f"{name}["):
                     self._preference_list.append(e)
         self.configure_from_file()
@@ -189,28 +486,105 @@ class Factory:
     def __getstate__(self):
         state = self.__dict__.copy()
         del state["_engines"]
+        del state["_engine_class_cache"]
+        del state["_engines_by_mode"]
         return state
 
     def __setstate__(self, state):
         self.__dict__.update(state)
         self._engines = {}
-        engines_info = list(self._engines_info)
-        self._engines_info = []
-        for name, module_name, class_name in engines_info:
+        self._engine_masks = {}
+        self._engine_class_cache = {}
+        self._engines_by_mode = {}
+        for name, (module_name, class_name) in self._engines_info.items():
             self._add_engine(name, module_name, class_name)
-        engines = dict(self._engines)
-        meta_engines_info = list(self._meta_engines_info)
-        self._meta_engines_info = []
-        for name, module_name, class_name in meta_engines_info:
-            for engine_name, engine in engines.items():
-                self._add_meta_engine(
-                    name, module_name, class_name, engine_name, engine
+        # The meta engines instantiations are added to _engines while iterating
+        engines = tuple(self._engines.items())
+        self._meta_engines = {}
+        for name, (module_name, class_name) in self._meta_engines_info.items():
+            MetaEngineClass = self._register_meta_engine(name, module_name, class_name)
+            for engine_name, engine in engines:
+                self._instantiate_meta_engine(
+                    name, MetaEngineClass, engine_name, engine
+                )
+
+    def _load_engine(self, name: str) -> Optional[Type["up.engines.engine.Engine"]]:
+        """
+        Returns the `Engine` class registered with the given name, importing its
+        module if this was not done yet, or `None` if the `Engine` is not available.
+        """
+        EngineClass = self._engines.get(name, None)
+        if EngineClass is not None:
+            return EngineClass
+        if name in self._lazy_engines:
+            module_name, class_name = self._lazy_engines[name]
+            available = module_name not in self._unavailable_modules
+            if available:
+                try:
+                    self._add_engine(name, module_name, class_name)
+                except ImportError:
+                    self._unavailable_modules.add(module_name)
+                    available = False
+            # Any other error is raised leaving the lazy entries in place, so
+            # that it is raised again every time the engine is needed
+            del self._lazy_engines[name]
+            waiting_meta_engines = [
+                (n, me_name)
+                for n, (me_name, engine_name) in self._lazy_meta_engines.items()
+                if engine_name == name
+            ]
+            for n, _ in waiting_meta_engines:
+                del self._lazy_meta_engines[n]
+            if not available:
+                self._remove_from_preference_list(
+                    [name] + [n for n, _ in waiting_meta_engines]
                 )
+                return None
+            EngineClass = self._engines[name]
+            self._remove_from_preference_list(
+                [
+                    n
+                    for n, me_name in waiting_meta_engines
+                    if not self._instantiate_meta_engine(
+                        me_name, self._meta_engines[me_name], name, EngineClass
+                    )
+                ]
+            )
+            return EngineClass
+        if name in self._lazy_meta_engines:
+            # Loading the engine also loads all the meta engines waiting for it
+            self._load_engine(self._lazy_meta_engines[name][1])
+            return self._engines.get(name, None)
+        return None
+
+    def _remove_from_preference_list(self, names: List[str]):
+        """
+        Removes the given names from the preference list, building a new list
+        so that lists given by the user are never modified.
+        """
+        if any(n in self._preference_list for n in names):
+            self._preference_list = [n for n in self._preference_list if n not in names]
+
+    def _load_all_engines(self):
+        """Imports all the `Engines` that are not imported yet."""
+        for name in list(self._lazy_engines.keys()):
+            self._load_engine(name)
+
+    def _engine_names(self) -> List[str]:
+        """
+        Returns the names of the loaded `Engines`: first the default `Engines`
+        and the default meta engines instances, then the added ones.
+        """
+        names = [n for n in self._default_engine_names if n in self._engines]
+        defaults = set(self._default_engine_names)
+        names.extend(n for n in self._engines if n not in defaults)
+        return names
 
     @property
     def engines(self) -> List[str]:
         """Returns the list of the available :class:`Engines <unified_planning.engines.Engine>` names."""
-        return list(self._engines.keys())
+        self._load_all_engines()
+        return self._engine_names()
 
     def engine(self, name: str) -> Type["up.engines.engine.Engine"]:
         """
@@ -219,11 +593,13 @@ class Factory:
         :param name: The name of the `engine` in the factory.
         :return: The `engine` Class.
         """
+        self._load_engine(name)
         return self._engines[name]
 
     @property
     def preference_list(self) -> List[str]:
         """Returns the current list of preferences."""
+        self._load_all_engines()
         return self._preference_list
 
     @preference_list.setter
@@ -238,7 +614,7 @@ class Factory:
         selected automatically. Note, however, that it can
         still be selected by using it's name in the Operation modes.
         """
-        self._preference_list = preference_list
+        self._preference_list = list(preference_list)
 
     def add_engine(self, name: str, module_name: str, class_name: str):
         """
@@ -248,14 +624,21 @@ class Factory:
         :param module_name: The `name` of the module in which the `engine Class` is defined.
         :param class_name: The `name` of the `engine Class`.
         """
+        # The engine names are interned, so that the lookups in the engines
+        # dict usually succeed with an identity check
+        name = sys.intern(name)
         self._add_engine(name, module_name, class_name)
+        # The lazy default engine with the same name, if any, is replaced only
+        # once the new engine is successfully imported
+        if self._lazy_engines.pop(name, None) is not None:
+            for n, (_, engine_name) in list(self._lazy_meta_engines.items()):
+                if engine_name == name:
+                    del self._lazy_meta_engines[n]
         self._preference_list.append(name)
         engine = self._engines[name]
         for me_name, me in self._meta_engines.items():
-            if me.is_compatible_engine(engine):
-                n = f"{me_name}[{name}]"
-                self._engines[n] = me[engine]
-                self._preference_list.append(n)
+            if self._instantiate_meta_engine(me_name, me, name, engine):
+                self._preference_list.append(sys.intern(f"{me_name}[{name}]"))
 
     def add_meta_engine(self, name: str, module_name: str, class_name: str):
         """
@@ -265,12 +648,14 @@ class Factory:
         :param module_name: The `name` of the module in which the `meta engine Class` is defined.
         :param class_name: The name of the `meta engine Class`.
         """
-        engines = dict(self._engines)
-        for engine_name, engine in engines.items():
-            self._add_meta_engine(name, module_name, class_name, engine_name, engine)
-            n = f"{name}[{engine_name}]"
-            if n in self.engines:
-                self._preference_list.append(n)
+        self._load_all_engines()
+        name = sys.intern(name)
+        MetaEngineClass = self._register_meta_engine(name, module_name, class_name)
+        for engine_name, engine in tuple(self._engines.items()):
+            if self._instantiate_meta_engine(
+                name, MetaEngineClass, engine_name, engine
+            ):
+                self._preference_list.append(sys.intern(f"{name}[{engine_name}]"))
 
     def configure_from_file(self, config_filename: Optional[str] = None):
         """
@@ -293,165 +678,227 @@ class Factory:
 
         :param config_filename: The path of the file containing the wanted configuration.
         """
-        config = configparser.ConfigParser()
         if config_filename is None:
-            files = get_possible_config_locations()
-            config.read(files)
+            files = _existing_config_files()
         else:
-            config.read([config_filename])
-
-        new_engine_sections = [
-            s for s in config.sections() if s.lower().startswith("engine ")
-        ]
-
-        for s in new_engine_sections:
-            name = s[len("engine ") :]
-
-            module_name = config.get(s, "module_name")
+            try:
+                files = [(config_filename, os.stat(config_filename).st_mtime_ns)]
+            except OSError:
+                files = []
+        if len(files) == 0:
+            return
+        config = _read_config(tuple(files))
+
+        new_engine_sections: List[Tuple[str, str]] = []
+        new_meta_engine_sections: List[Tuple[str, str]] = []
+        for s in config:
+            ls = s.lower()
+            if ls.startswith("engine "):
+                new_engine_sections.append((s, s[len("engine ") :]))
+            elif ls.startswith("meta-engine "):
+                new_meta_engine_sections.append((s, s[len("meta-engine ") :]))
+
+        for s, name in new_engine_sections:
+            module_name = config[s].get("module_name")
             assert module_name is not None, (
                 "Missing 'module_name' value in definition" "of '%s' engine" % name
             )
 
-            class_name = config.get(s, "class_name")
+            class_name = config[s].get("class_name")
             assert class_name is not None, (
                 "Missing 'class_name' value in definition" "of '%s' engine" % name
             )
 
             self.add_engine(name, module_name, class_name)
 
-        new_meta_engine_sections = [
-            s for s in config.sections() if s.lower().startswith("meta-engine ")
-        ]
-
-        for s in new_meta_engine_sections:
-            name = s[len("meta-engine ") :]
-
-            module_name = config.get(s, "module_name")
+        for s, name in new_meta_engine_sections:
+            module_name = config[s].get("module_name")
             assert module_name is not None, (
                 "Missing 'module_name' value in definition of '%s' meta-engine" % name
             )
 
-            class_name = config.get(s, "class_name")
+            class_name = config[s].get("class_name")
             assert class_name is not None, (
                 "Missing 'class_name' value in definition of '%s' meta-engine" % name
             )
 
             self.add_meta_engine(name, module_name, class_name)
 
-        if "global" in config.sections():
-            pref_list = config.get("global", "engine_preference_list")
+        if "global" in config:
+            pref_list = config["global"].get("engine_preference_list")
 
             if pref_list is not None:
-                prefs = [x.strip() for x in pref_list.split() if len(x.strip()) > 0]
+                prefs = [sys.intern(x) for x in pref_list.split()]
                 self.preference_list = [e for e in prefs if e in self.engines]
 
     def _add_engine(self, name: str, module_name: str, class_name: str):
+        if name in self._engines and self._engines_info.get(name) == (
+            module_name,
+            class_name,
+        ):
+            return
         module = importlib.import_module(module_name)
         EngineImpl = getattr(module, class_name)
+        if name in self._engines:
+            self._clear_engine_caches()
         self._engines[name] = EngineImpl
-        self._engines_info.append((name, module_name, class_name))
+        self._engine_masks[name] = _operation_modes_mask(EngineImpl)
+        self._engines_info[name] = (module_name, class_name)
 
-    def _add_meta_engine(
+    def _register_meta_engine(
+        self, name: str, module_name: str, class_name: str
+    ) -> Type["up.engines.meta_engine.MetaEngine"]:
+        module = importlib.import_module(module_name)
+        MetaEngineClass = getattr(module, class_name)
+        self._meta_engines[name] = MetaEngineClass
+        self._meta_engines_info[name] = (module_name, class_name)
+        return MetaEngineClass
+
+    def _instantiate_meta_engine(
         self,
         name: str,
-        module_name: str,
-        class_name: str,
+        MetaEngineClass: Type["up.engines.meta_engine.MetaEngine"],
         engine_name: str,
         engine: Type["up.engines.engine.Engine"],
-    ):
-        if name in self._meta_engines:
-            EngineImpl = self._meta_engines[name]
-        else:
-            module = importlib.import_module(module_name)
-            EngineImpl = getattr(module, class_name)
-            self._meta_engines[name] = EngineImpl
-            self._meta_engines_info.append((name, module_name, class_name))
-        if EngineImpl.is_compatible_engine(engine):
-            self._engines[f"{name}[{engine_name}]"] = EngineImpl[engine]
+    ) -> bool:
+        """
+        Adds the `Engine` obtained instantiating the given `MetaEngine` over the
+        given `Engine`; returns `False` if the two are not compatible.
+        """
+        if not _is_compatible_engine(MetaEngineClass, engine):
+            return False
+        n = sys.intern(f"{name}[{engine_name}]")
+        if n in self._engines:
+            self._clear_engine_caches()
+        self._engines[n] = MetaEngineClass[engine]
+        self._engine_masks[n] = _operation_modes_mask(self._engines[n])
+        return True
+
+    def _clear_engine_caches(self):
+        """
+        Clears the caches of the selected engines; needed when the class
+        registered with an already loaded name is replaced.
+        """
+        self._engine_class_cache.clear()
+        self._engines_by_mode.clear()
+
+    def _check_preference_caches(self):
+        """Clears the caches depending on the preference list if it was changed."""
+        if self._preference_list != self._cached_preference_list:
+            self._clear_engine_caches()
+            self._cached_preference_list = list(self._preference_list)
+
+    def _engines_for_mode(self, operation_mode: "OperationMode") -> Tuple[str, ...]:
+        """
+        Returns the names of the `Engines` in the preference list that implement
+        the given `OperationMode`, in order of preference.
+        """
+        names = self._engines_by_mode.get(operation_mode, None)
+        if names is None:
+            bit = _OPERATION_MODE_BITS[operation_mode]
+            names = tuple(
+                name
+                for name in tuple(self._preference_list)
+                if self._load_engine(name) is not None
+                and self._engine_masks[name] & bit
+            )
+            self._engines_by_mode[operation_mode] = names
+            # Loading the engines removes the unavailable ones from the
+            # preference list, this does not invalidate the caches.
+            self._cached_preference_list = list(self._preference_list)
+        return names
 
     def _get_engine_class(
         self,
         operation_mode: "OperationMode",
         name: Optional[str] = None,
-        problem_kind: ProblemKind = ProblemKind(),
+        problem_kind: Optional[ProblemKind] = _EMPTY_KIND,
         optimality_guarantee: Optional["OptimalityGuarantee"] = None,
         compilation_kind: Optional["CompilationKind"] = None,
         plan_kind: Optional["PlanKind"] = None,
         anytime_guarantee: Optional["AnytimeGuarantee"] = None,
     ) -> Type["up.engines.engine.Engine"]:
         if name is not None:
-            if name in self._engines:
-                return self._engines[name]
+            EngineClass = self._load_engine(name)
+            if EngineClass is not None:
+                return EngineClass
             else:
                 raise up.exceptions.UPNoRequestedEngineAvailableException
-        problem_features = list(problem_kind.features)
-        planners_features = []
+        # The problem kind can be omitted only when the engine is given by name
+        assert problem_kind is not None
         # Make sure that optimality guarantees and compilation kind are mutually exclusive
         assert optimality_guarantee is None or compilation_kind is None
-        for name in self._preference_list:
+        self._check_preference_caches()
+        key = (
+            operation_mode,
+            frozenset(problem_kind.features),
+            optimality_guarantee,
+            compilation_kind,
+            plan_kind,
+            anytime_guarantee,
+        )
+        EngineClass = self._engine_class_cache.get(key, None)
+        if EngineClass is not None:
+            return EngineClass
+        # Each operation mode accepts at most one kind of requirement, checked
+        # once here instead of for every engine in the loop below
+        if (
+            operation_mode == OperationMode.ONESHOT_PLANNER
+            or operation_mode == OperationMode.REPLANNER
+            or operation_mode == OperationMode.PORTFOLIO_SELECTOR
+        ):
+            assert anytime_guarantee is None
+            assert compilation_kind is None
+            assert plan_kind is None
+        elif operation_mode == OperationMode.PLAN_VALIDATOR:
+            assert optimality_guarantee is None
+            assert anytime_guarantee is None
+            assert compilation_kind is None
+        elif operation_mode == OperationMode.COMPILER:
+            assert optimality_guarantee is None
+            assert anytime_guarantee is None
+            assert plan_kind is None
+        elif operation_mode == OperationMode.ANYTIME_PLANNER:
+            assert optimality_guarantee is None
+            assert compilation_kind is None
+            assert plan_kind is None
+        else:
+            assert optimality_guarantee is None
+            assert anytime_guarantee is None
+            assert compilation_kind is None
+            assert plan_kind is None
+        # The engines that do not support the problem kind, used to report the error
+        unsupporting_engines: List[Tuple[str, Type["up.engines.engine.Engine"]]] = []
+        for name in self._engines_for_mode(operation_mode):
             EngineClass = self._engines[name]
-            if getattr(EngineClass, "is_" + operation_mode.value)():
-                if (
-                    operation_mode == OperationMode.ONESHOT_PLANNER
-                    or operation_mode == OperationMode.REPLANNER
-                    or operation_mode == OperationMode.PORTFOLIO_SELECTOR
-                ):
-                    assert (
-                        issubclass(EngineClass, OneshotPlannerMixin)
-                        or issubclass(EngineClass, ReplannerMixin)
-                        or issubclass(EngineClass, PortfolioSelectorMixin)
-                    )
-                    assert anytime_guarantee is None
-                    assert compilation_kind is None
-                    assert plan_kind is None
-                    if optimality_guarantee is not None and not EngineClass.satisfies(
-                        optimality_guarantee
-                    ):
-                        continue
-                elif operation_mode == OperationMode.PLAN_VALIDATOR:
-                    assert issubclass(EngineClass, PlanValidatorMixin)
-                    assert optimality_guarantee is None
-                    assert anytime_guarantee is None
-                    assert compilation_kind is None
-                    if plan_kind is not None and not EngineClass.supports_plan(
-                        plan_kind
-                    ):
-                        continue
-                elif operation_mode == OperationMode.COMPILER:
-                    assert issubclass(EngineClass, CompilerMixin)
-                    assert optimality_guarantee is None
-                    assert anytime_guarantee is None
-                    assert plan_kind is None
-                    if (
-                        compilation_kind is not None
-                        and not EngineClass.supports_compilation(compilation_kind)
-                    ):
-                        continue
-                elif operation_mode == OperationMode.ANYTIME_PLANNER:
-                    assert issubclass(EngineClass, AnytimePlannerMixin)
-                    assert optimality_guarantee is None
-                    assert compilation_kind is None
-                    assert plan_kind is None
-                    if anytime_guarantee is not None and not EngineClass.ensures(
-                        anytime_guarantee
-                    ):
-                        continue
-                else:
-                    assert optimality_guarantee is None
-                    assert anytime_guarantee is None
-                    assert compilation_kind is None
-                    assert plan_kind is None
-                if EngineClass.supports(problem_kind):
-                    return EngineClass
-                else:
-                    x = [name] + [
-                        str(EngineClass.supports(ProblemKind({f})))
-                        for f in problem_features
-                    ]
-                    planners_features.append(x)
-        if len(planners_features) > 0:
-            header = ["Engine"] + problem_features
-            msg = f"No available engine supports all the problem features:\n{format_table(header, planners_features)}"
+            if optimality_guarantee is not None:
+                assert (
+                    issubclass(EngineClass, OneshotPlannerMixin)
+                    or issubclass(EngineClass, ReplannerMixin)
+                    or issubclass(EngineClass, PortfolioSelectorMixin)
+                )
+                if not EngineClass.satisfies(optimality_guarantee):
+                    continue
+            elif plan_kind is not None:
+                assert issubclass(EngineClass, PlanValidatorMixin)
+                if not EngineClass.supports_plan(plan_kind):
+                    continue
+            elif compilation_kind is not None:
+                assert issubclass(EngineClass, CompilerMixin)
+                if not EngineClass.supports_compilation(compilation_kind):
+                    continue
+            elif anytime_guarantee is not None:
+                assert issubclass(EngineClass, AnytimePlannerMixin)
+                if not EngineClass.ensures(anytime_guarantee):
+                    continue
+            if _supports_kind(EngineClass, key[1]):
+                self._engine_class_cache[key] = EngineClass
+                return EngineClass
+            else:
+                unsupporting_engines.append((name, EngineClass))
+        if len(unsupporting_engines) > 0:
+            table = _unsupported_features_table(tuple(unsupporting_engines), key[1])
+            msg = f"No available engine supports all the problem features:\n{table}"
         elif compilation_kind is not None:
             msg = f"No available engine supports {compilation_kind}"
         elif plan_kind is not None:
@@ -468,19 +915,23 @@ class Factory:
         """
         This function prints the credits of the engine(s) used by an operation mode
         """
+        if self.environment.credits_stream is None:
+            return
         credits: List["up.engines.Credits"] = [c for c in all_credits if c is not None]
         if len(credits) == 0:
             return
 
-        stack = inspect.stack()
-        fname = stack[3].filename
+        # The frames are: 0 this method, 1 _get_engine, 2 the operation mode
+        # method of the Factory, 3 its caller (possibly unified_planning.shortcuts)
+        frame = sys._getframe(3)
+        fname = frame.f_code.co_filename
         if "unified_planning/shortcuts.py" in fname:
-            fname = stack[4].filename
-            operation_mode_name = stack[3].function
-            line = stack[4].lineno
+            operation_mode_name = frame.f_code.co_name
+            frame = sys._getframe(4)
+            fname = frame.f_code.co_filename
         else:
-            operation_mode_name = stack[2].function
-            line = stack[3].lineno
+            operation_mode_name = sys._getframe(2).f_code.co_name
+        line = frame.f_lineno
 
         class PaleWriter(up.AnyBaseClass):
             def __init__(self, stream: IO[str]):
@@ -491,27 +942,26 @@ class Factory:
                 self._stream.write(txt)
                 self._stream.write("\033[0m")
 
-        if self.environment.credits_stream is not None:
-            w = PaleWriter(self.environment.credits_stream)
+        w = PaleWriter(self.environment.credits_stream)
 
-            if not self._credit_disclaimer_printed:
-                self._credit_disclaimer_printed = True
-                w.write(
-                    f"\033[1mNOTE: To disable printing of planning engine credits, add this line to your code: `up.shortcuts.get_env().credits_stream = None`\n"
-                )
-            w.write("  *** Credits ***\n")
+        if not self._credit_disclaimer_printed:
+            self._credit_disclaimer_printed = True
             w.write(
-                f"  * In operation mode `{operation_mode_name}` at line {line} of `{fname}`, "
+                f"\033[1mNOTE: To disable printing of planning engine credits, add this line to your code: `up.shortcuts.get_env().credits_stream = None`\n"
             )
-            if len(credits) > 1:
-                w.write(
-                    "you are using a parallel planning engine with the following components:\n"
-                )
-            else:
-                w.write("you are using the following planning engine:\n")
-            for c in credits:
-                c.write_credits(w)
-            w.write("\n")
+        w.write("  *** Credits ***\n")
+        w.write(
+            f"  * In operation mode `{operation_mode_name}` at line {line} of `{fname}`, "
+        )
+        if len(credits) > 1:
+            w.write(
+                "you are using a parallel planning engine with the following components:\n"
+            )
+        else:
+            w.write("you are using the following planning engine:\n")
+        for c in credits:
+            c.write_credits(w)
+        w.write("\n")
 
     def _get_engine(
         self,
@@ -519,7 +969,7 @@ class Factory:
         name: Optional[str] = None,
         names: Optional[List[str]] = None,
         params: Optional[Union[Dict[str, str], List[Dict[str, str]]]] = None,
-        problem_kind: ProblemKind = ProblemKind(),
+        problem_kind: Optional[ProblemKind] = _EMPTY_KIND,
         optimality_guarantee: Optional["OptimalityGuarantee"] = None,
         compilation_kind: Optional["CompilationKind"] = None,
         compilation_kinds: Optional[List["CompilationKind"]] = None,
@@ -544,7 +994,7 @@ class Factory:
             return p_engine
         elif operation_mode == OperationMode.COMPILER and compilation_kinds is not None:
             assert name is None
-            assert names is not None or problem_kind is not None
+            assert problem_kind is not None
             if names is None:
                 names = [None for i in range(len(compilation_kinds))]  # type: ignore
             if params is None:
@@ -586,48 +1036,17 @@ class Factory:
             )
             credits = EngineClass.get_credits(**params)
             self._print_credits([credits])
-            if operation_mode == OperationMode.REPLANNER:
-                assert problem is not None
-                if (
-                    problem.kind.has_quality_metrics()
-                    and optimality_guarantee == OptimalityGuarantee.SOLVED_OPTIMALLY
-                ):
-                    msg = f"The problem has no quality metrics but the engine is required to be optimal!"
-                    raise up.exceptions.UPUsageError(msg)
-                res = EngineClass(problem=problem, **params)
-            elif operation_mode == OperationMode.SIMULATOR:
-                assert problem is not None
-                res = EngineClass(
-                    problem=problem,
-                    error_on_failed_checks=error_failed_checks,
-                    **params,
-                )
-                assert isinstance(res, SimulatorMixin)
-            elif operation_mode == OperationMode.COMPILER:
-                res = EngineClass(**params)
-                assert isinstance(res, CompilerMixin)
-                if compilation_kind is not None:
-                    res.default = compilation_kind
-            elif (
-                operation_mode == OperationMode.ONESHOT_PLANNER
-                or operation_mode == OperationMode.PORTFOLIO_SELECTOR
-            ):
-                res = EngineClass(**params)
-                assert isinstance(res, OneshotPlannerMixin) or isinstance(
-                    res, PortfolioSelectorMixin
-                )
-                if optimality_guarantee == OptimalityGuarantee.SOLVED_OPTIMALLY:
-                    res.optimality_metric_required = True
-            elif operation_mode == OperationMode.ANYTIME_PLANNER:
-                res = EngineClass(**params)
-                assert isinstance(res, AnytimePlannerMixin)
-                if (
-                    anytime_guarantee == AnytimeGuarantee.INCREASING_QUALITY
-                    or anytime_guarantee == AnytimeGuarantee.OPTIMAL_PLANS
-                ):
-                    res.optimality_metric_required = True
-            else:
-                res = EngineClass(**params)
+            instantiate = _INSTANTIATORS.get(operation_mode, _instantiate_engine)
+            res = instantiate(
+                EngineClass,
+                params,
+                problem=problem,
+                problem_kind=problem_kind,
+                error_on_failed_checks=error_failed_checks,
+                optimality_guarantee=optimality_guarantee,
+                compilation_kind=compilation_kind,
+                anytime_guarantee=anytime_guarantee,
+            )
             res.error_on_failed_checks = error_failed_checks
             return res
 
@@ -642,7 +1061,7 @@ class Factory:
         name: Optional[str] = None,
         names: Optional[List[str]] = None,
         params: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
-        problem_kind: ProblemKind = ProblemKind(),
+        problem_kind: ProblemKind = _EMPTY_KIND,
         optimality_guarantee: Optional[Union["OptimalityGuarantee", str]] = None,
     ) -> "up.engines.engine.Engine":
         """
@@ -656,8 +1075,7 @@ class Factory:
         - using 'problem_kind' and 'optimality_guarantee'.
           e.g. OneshotPlanner(problem_kind=problem.kind, optimality_guarantee=SOLVED_OPTIMALLY)
         """
-        if isinstance(optimality_guarantee, str):
-            optimality_guarantee = OptimalityGuarantee[optimality_guarantee]
+        optimality_guarantee = _coerce_enum(OptimalityGuarantee, optimality_guarantee)
         return self._get_engine(
             OperationMode.ONESHOT_PLANNER,
             name,
@@ -672,7 +1090,7 @@ class Factory:
         *,
         name: Optional[str] = None,
         params: Optional[Dict[str, str]] = None,
-        problem_kind: ProblemKind = ProblemKind(),
+        problem_kind: ProblemKind = _EMPTY_KIND,
         anytime_guarantee: Optional[Union["AnytimeGuarantee", str]] = None,
     ) -> "up.engines.engine.Engine":
         """
@@ -691,8 +1109,7 @@ class Factory:
         It raises an exception if the problem has no optimality metrics and anytime_guarantee
         is equal to INCREASING_QUALITY or OPTIMAL_PLAN.
         """
-        if isinstance(anytime_guarantee, str):
-            anytime_guarantee = AnytimeGuarantee[anytime_guarantee]
+        anytime_guarantee = _coerce_enum(AnytimeGuarantee, anytime_guarantee)
         return self._get_engine(
             OperationMode.ANYTIME_PLANNER,
             name,
@@ -708,7 +1125,7 @@ class Factory:
         name: Optional[str] = None,
         names: Optional[List[str]] = None,
         params: Optional[Union[Dict[str, str], List[Dict[str, str]]]] = None,
-        problem_kind: ProblemKind = ProblemKind(),
+        problem_kind: ProblemKind = _EMPTY_KIND,
         plan_kind: Optional[Union["PlanKind", str]] = None,
     ) -> "up.engines.engine.Engine":
         """
@@ -723,8 +1140,7 @@ class Factory:
         - using 'problem_kind' and 'plan_kind' parameters.
           e.g. PlanValidator(problem_kind=problem.kind, plan_kind=plan.kind)
         """
-        if isinstance(plan_kind, str):
-            plan_kind = PlanKind[plan_kind]
+        plan_kind = _coerce_enum(PlanKind, plan_kind)
         return self._get_engine(
             OperationMode.PLAN_VALIDATOR,
             name,
@@ -740,7 +1156,7 @@ class Factory:
         name: Optional[str] = None,
         names: Optional[List[str]] = None,
         params: Optional[Union[Dict[str, str], List[Dict[str, str]]]] = None,
-        problem_kind: ProblemKind = ProblemKind(),
+        problem_kind: ProblemKind = _EMPTY_KIND,
         compilation_kind: Optional[Union["CompilationKind", str]] = None,
         compilation_kinds: Optional[List[Union["CompilationKind", str]]] = None,
     ) -> "up.engines.engine.Engine":
@@ -764,18 +1180,11 @@ class Factory:
           e.g. Compiler(problem_kind=problem.kind,
                         compilation_kinds=[QUANTIFIERS_REMOVING, GROUNDING])
         """
-        if isinstance(compilation_kind, str):
-            compilation_kind = CompilationKind[compilation_kind]
+        compilation_kind = _coerce_enum(CompilationKind, compilation_kind)
 
         kinds: Optional[List[CompilationKind]] = None
         if compilation_kinds is not None:
-            kinds = []
-            for kind in compilation_kinds:
-                if isinstance(kind, str):
-                    kinds.append(CompilationKind[kind])
-                else:
-                    assert isinstance(kind, CompilationKind)
-                    kinds.append(kind)
+            kinds = [_coerce_enum(CompilationKind, k) for k in compilation_kinds]
 
         return self._get_engine(
             OperationMode.COMPILER,
@@ -802,8 +1211,10 @@ class Factory:
           (simulator dependent options).
           e.g. Simulator(problem, name='sequential_simulator')
         """
+        # The problem kind is not needed when the engine is given by name
+        problem_kind = problem.kind if name is None else None
         return self._get_engine(
-            OperationMode.SIMULATOR, name, None, params, problem.kind, problem=problem
+            OperationMode.SIMULATOR, name, None, params, problem_kind, problem=problem
         )
 
     def Replanner(
@@ -822,14 +1233,15 @@ class Factory:
           (replanner dependent options).
           e.g. Replanner(problem, name='replanner[tamer]')
         """
-        if isinstance(optimality_guarantee, str):
-            optimality_guarantee = OptimalityGuarantee[optimality_guarantee]
+        optimality_guarantee = _coerce_enum(OptimalityGuarantee, optimality_guarantee)
+        # The problem kind is not needed when the engine is given by name
+        problem_kind = problem.kind if name is None else None
         return self._get_engine(
             OperationMode.REPLANNER,
             name,
             None,
             params,
-            problem.kind,
+            problem_kind,
             optimality_guarantee,
             problem=problem,
         )
@@ -839,7 +1251,7 @@ class Factory:
         *,
         name: Optional[str] = None,
         params: Optional[Dict[str, Any]] = None,
-        problem_kind: ProblemKind = ProblemKind(),
+        problem_kind: ProblemKind = _EMPTY_KIND,
         optimality_guarantee: Optional[Union["OptimalityGuarantee", str]] = None,
     ) -> "up.engines.engine.Engine":
         """
@@ -850,8 +1262,7 @@ class Factory:
         - using 'problem_kind' and 'optimality_guarantee'.
           e.g. OneshotPlanner(problem_kind=problem.kind, optimality_guarantee=SOLVED_OPTIMALLY)
         """
-        if isinstance(optimality_guarantee, str):
-            optimality_guarantee = OptimalityGuarantee[optimality_guarantee]
+        optimality_guarantee = _coerce_enum(OptimalityGuarantee, optimality_guarantee)
         return self._get_engine(
             OperationMode.PORTFOLIO_SELECTOR,
             name=name,
@@ -860,15 +1271,34 @@ class Factory:
             optimality_guarantee=optimality_guarantee,
         )
 
+    def warm(self):
+        """
+        Imports all the available :class:`Engines <unified_planning.engines.Engine>` and computes,
+        for every :class:`~unified_planning.engines.engine.OperationMode`, the preferred `Engines`
+        implementing it; this way the first request of an `Engine` does not pay for it.
+
+        The work done is lost if the :func:`preference_list <unified_planning.engines.Factory.preference_list>`
+        is changed afterwards.
+        """
+        self._load_all_engines()
+        self._check_preference_caches()
+        for operation_mode in OperationMode:
+            self._engines_for_mode(operation_mode)
+
     def print_engines_info(
         self, stream: IO[str] = sys.stdout, full_credits: bool = True
     ):
-        stream.write("These are the engines currently available:\n")
-        for Engine in self._engines.values():
-            credits = Engine.get_credits()
+        self._load_all_engines()
+        # The info is written to a buffer and then to the stream all at once
+        buffer = io.StringIO()
+        buffer.write("These are the engines currently available:\n")
+        for name in self._engine_names():
+            Engine = self._engines[name]
+            credits = _default_credits(Engine)
             if credits is not None:
-                stream.write("---------------------------------------\n")
-                credits.write_credits(stream, full_credits)
-                stream.write(
+                buffer.write("---------------------------------------\n")
+                credits.write_credits(buffer, full_credits)
+                buffer.write(
                     f"This engine supports the following features:\n{str(Engine.supported_kind())}\n\n"
                 )
+        stream.write(buffer.getvalue())
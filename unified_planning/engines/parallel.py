@@ -117,6 +117,8 @@ class Parallel(
                     results.append(res)
         for p in processes:
             p.terminate()
+        for p in processes:
+            p.join()
         if definitive_result_found:  # A planner found a definitive result
             return [res]
         return results
@@ -188,10 +190,11 @@ class Parallel(
     def _validate(
         self, problem: "up.model.AbstractProblem", plan: Plan
     ) -> "up.engines.results.ValidationResult":
+        problem_kind = problem.kind
         for engine_name, _ in self.engines:
             engine = self._factory.engine(engine_name)
             assert issubclass(engine, engines.mixins.PlanValidatorMixin)
-            if not engine.supports(problem.kind):
+            if not engine.supports(problem_kind):
                 raise UPUsageError(
                     "Parallel engines cannot validate this kind of problem!"
                 )
@@ -1,4 +1,23 @@
 from unified_planning.io.python_writer import PythonWriter
-from unified_planning.io.pddl_reader import PDDLReader
 from unified_planning.io.pddl_writer import PDDLWriter
 from unified_planning.io.anml_writer import ANMLWriter
+from typing import Any, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from unified_planning.io.pddl_reader import PDDLReader
+
+__all__ = ["PythonWriter", "PDDLWriter", "PDDLReader", "ANMLWriter"]
+
+
+def __getattr__(name: str) -> Any:
+    # The PDDLReader is imported on first access because it depends on
+    # pyparsing, which is an optional dependency.
+    if name == "PDDLReader":
+        from unified_planning.io.pddl_reader import PDDLReader
+
+        return PDDLReader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | {"PDDLReader"})
@@ -25,7 +25,12 @@ from collections import OrderedDict
 from fractions import Fraction
 from typing import Dict, Union, Callable, List, cast
 
-import pyparsing
+try:
+    import pyparsing
+except ImportError as e:
+    raise ImportError(
+        "The PDDLReader needs pyparsing installed, run: pip install unified-planning[pddl]"
+    ) from e
 
 assert (
     pyparsing.__version__ >= "3.0.0"
@@ -90,6 +90,8 @@ class ProblemKind(up.AnyBaseClass, metaclass=ProblemKindMeta):
     The `ProblemKind` of a `Problem` is calculated by it's :func:`kind <unified_planning.model.Problem.kind>` property.
     """
 
+    __slots__ = ["_features"]
+
     def __init__(self, features: Set[str] = set()):
         self._features: Set[str] = set(features)
 
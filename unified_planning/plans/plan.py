@@ -32,6 +32,8 @@ class ActionInstance:
     considered different as it is possible to have the same action twice in a `Plan`.
     """
 
+    __slots__ = ["_agent", "_action", "_params", "_params_str"]
+
     def __init__(
         self,
         action: "up.model.Action",
@@ -42,23 +44,21 @@ class ActionInstance:
         self._agent = agent
         self._action = action
         self._params = tuple(params)
+        # The string of the actual parameters, computed the first time it is needed;
+        # the parameters can not change, unlike the name of the action.
+        self._params_str: Optional[str] = None
 
     def __repr__(self) -> str:
-        s = []
-        if len(self._params) > 0:
-            s.append("(")
-            first = True
-            for p in self._params:
-                if not first:
-                    s.append(", ")
-                s.append(str(p))
-                first = False
-            s.append(")")
+        if self._params_str is None:
+            if len(self._params) > 0:
+                self._params_str = f"({', '.join(str(p) for p in self._params)})"
+            else:
+                self._params_str = ""
         if self._agent is None:
             name = self._action.name
         else:
             name = f"{self._agent.name}.{self._action.name}"
-        return name + "".join(s)
+        return name + self._params_str
 
     @property
     def agent(self) -> Optional["up.model.multi_agent.Agent"]:
@@ -14,7 +14,6 @@
 #
 
 
-import networkx as nx
 import unified_planning as up
 import unified_planning.plans as plans
 import unified_planning.model.walkers as walkers
@@ -120,6 +119,8 @@ class SequentialPlan(plans.plan.Plan):
         :param problem: The `problem` for which this `SequentialPlan` is created.
         :return: A `PartialOrderPlan` compatible with the given `problem`.
         """
+        import networkx as nx
+
         subs = walkers.Substituter(self._environment)
         simp = self._environment.simplifier
         eqr = walkers.ExpressionQuantifiersRemover(self._environment)
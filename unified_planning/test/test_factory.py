@@ -17,9 +17,14 @@ import inspect
 import tempfile
 import unified_planning
 from unified_planning.shortcuts import *
+from unified_planning.engines.compilers import Grounder
 from unified_planning.test import TestCase, skipIfEngineNotAvailable
 
 
+class MyGrounder(Grounder):
+    pass
+
+
 class TestFactory(TestCase):
     @skipIfEngineNotAvailable("pyperplan")
     @skipIfEngineNotAvailable("tamer")
@@ -34,3 +39,125 @@ class TestFactory(TestCase):
             env.factory.configure_from_file(config_filename)
             self.assertTrue("pyperplan" not in env.factory.preference_list)
             self.assertEqual(env.factory.preference_list, ["tamer"])
+
+    def test_lazy_engines(self):
+        env = unified_planning.environment.Environment()
+        factory = env.factory
+        self.assertEqual(factory.engine("up_grounder").__name__, "Grounder")
+        engines = factory.engines
+        for name in factory.preference_list:
+            self.assertTrue(name in engines)
+        with self.assertRaises(up.exceptions.UPNoRequestedEngineAvailableException):
+            factory._get_engine_class(OperationMode.ONESHOT_PLANNER, "non-existing")
+        factory._lazy_engines["missing-1"] = ("non_existing_module", "EngineA")
+        factory._lazy_engines["missing-2"] = ("non_existing_module", "EngineB")
+        self.assertIsNone(factory._load_engine("missing-1"))
+        self.assertTrue("non_existing_module" in factory._unavailable_modules)
+        self.assertIsNone(factory._load_engine("missing-2"))
+
+    def test_lazy_engine_wrong_class_name(self):
+        env = unified_planning.environment.Environment()
+        factory = env.factory
+        factory._lazy_engines["wrong_grounder"] = (
+            "unified_planning.engines.compilers.grounder",
+            "NoSuchGrounder",
+        )
+        factory.preference_list = ["wrong_grounder", "up_grounder"]
+        for _ in range(2):
+            with self.assertRaises(AttributeError):
+                factory.engine("wrong_grounder")
+        self.assertEqual(factory._preference_list, ["wrong_grounder", "up_grounder"])
+
+    def test_add_engine_import_error(self):
+        env = unified_planning.environment.Environment()
+        factory = env.factory
+        with self.assertRaises(ImportError):
+            factory.add_engine("up_grounder", "non_existing_module", "Grounder")
+        self.assertEqual(factory.engine("up_grounder").__name__, "Grounder")
+        self.assertTrue("up_grounder" in factory.engines)
+
+    def test_engines_order(self):
+        env = unified_planning.environment.Environment()
+        factory = env.factory
+        factory.engine("up_grounder")
+        engines = factory.engines
+        defaults = [n for n in engines if "[" not in n]
+        self.assertEqual(engines[: len(defaults)], defaults)
+        self.assertTrue(
+            engines.index("up_quantifiers_remover") < engines.index("up_grounder")
+        )
+
+    def test_preference_list_not_modified(self):
+        env = unified_planning.environment.Environment()
+        factory = env.factory
+        preference_list = ["up_grounder", "not_installed_engine"]
+        factory.preference_list = preference_list
+        factory.preference_list.remove("not_installed_engine")
+        self.assertEqual(preference_list, ["up_grounder", "not_installed_engine"])
+
+    def test_warm(self):
+        env = unified_planning.environment.Environment()
+        factory = env.factory
+        factory.warm()
+        self.assertEqual(len(factory._lazy_engines), 0)
+        for operation_mode in OperationMode:
+            self.assertTrue(operation_mode in factory._engines_by_mode)
+        self.assertTrue(
+            "up_grounder" in factory._engines_by_mode[OperationMode.COMPILER]
+        )
+
+    def test_engine_class_cache(self):
+        env = unified_planning.environment.Environment()
+        factory = env.factory
+        factory.preference_list = ["up_grounder"]
+        for _ in range(2):
+            EngineClass = factory._get_engine_class(
+                OperationMode.COMPILER, compilation_kind=CompilationKind.GROUNDING
+            )
+            self.assertEqual(EngineClass, factory.engine("up_grounder"))
+        factory.preference_list = ["up_quantifiers_remover"]
+        with self.assertRaises(up.exceptions.UPNoSuitableEngineAvailableException):
+            factory._get_engine_class(
+                OperationMode.COMPILER, compilation_kind=CompilationKind.GROUNDING
+            )
+
+    def test_engine_class_cache_replaced_engine(self):
+        env = unified_planning.environment.Environment()
+        factory = env.factory
+        factory.preference_list = ["up_grounder"]
+        EngineClass = factory._get_engine_class(
+            OperationMode.COMPILER, compilation_kind=CompilationKind.GROUNDING
+        )
+        self.assertEqual(EngineClass, Grounder)
+        factory.add_engine("up_grounder", __name__, "MyGrounder")
+        factory.preference_list = ["up_grounder"]
+        self.assertEqual(factory.engine("up_grounder"), MyGrounder)
+        EngineClass = factory._get_engine_class(
+            OperationMode.COMPILER, compilation_kind=CompilationKind.GROUNDING
+        )
+        self.assertEqual(EngineClass, MyGrounder)
+
+    def test_config_file_engines(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            config_filename = os.path.join(tempdir, "up.ini")
+            with open(config_filename, "w") as config:
+                config.write("[engine my_grounder]\n")
+                config.write(
+                    "module_name: unified_planning.engines.compilers.grounder\n"
+                )
+                config.write("class_name: Grounder\n")
+                config.write("[global]\n")
+                config.write("engine_preference_list: my_grounder up_grounder\n")
+            env = unified_planning.environment.Environment()
+            env.factory.configure_from_file(config_filename)
+            self.assertEqual(
+                env.factory.preference_list, ["my_grounder", "up_grounder"]
+            )
+            mtime = os.stat(config_filename).st_mtime_ns
+            with open(config_filename, "w") as config:
+                config.write("[global]\n")
+                config.write("engine_preference_list: up_grounder\n")
+            # make sure the modification is detected on coarse-grained filesystems
+            os.utime(config_filename, ns=(mtime + 10**9, mtime + 10**9))
+            env.factory.configure_from_file(config_filename)
+            self.assertEqual(env.factory.preference_list, ["up_grounder"])
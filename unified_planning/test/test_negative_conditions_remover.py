@@ -14,10 +14,11 @@
 
 
 from fractions import Fraction
+from typing import Dict
 import os
 from unified_planning.plans import ActionInstance
 import unified_planning
-from unified_planning.environment import get_env
+from unified_planning.environment import Environment, get_env
 from unified_planning.shortcuts import *
 from unified_planning.test import (
     TestCase,
@@ -26,6 +27,7 @@ from unified_planning.test import (
     skipIfNoOneshotPlannerForProblemKind,
 )
 from unified_planning.test.examples import get_example_problems
+from unified_planning.test.examples.minimals import Example
 from unified_planning.model.problem_kind import (
     basic_classical_kind,
     classical_kind,
@@ -41,10 +43,15 @@ from unified_planning.exceptions import (
 
 
 class TestNegativeConditionsRemover(TestCase):
-    def setUp(self):
-        TestCase.setUp(self)
-        self.env = get_env()
-        self.problems = get_example_problems()
+    env: Environment
+    problems: Dict[str, Example]
+
+    @classmethod
+    def setUpClass(cls):
+        # The example problems are only read by the tests, so they are built once
+        super().setUpClass()
+        cls.env = get_env()
+        cls.problems = get_example_problems()
 
     @skipIfNoOneshotPlannerForProblemKind(basic_classical_kind)
     @skipIfNoPlanValidatorForProblemKind(classical_kind)